@@ -8,13 +8,16 @@ def main():
         result = subprocess.run(
             ["uv", "run", "make"],
             capture_output=True,
-            text=True,
             check=False
         )
 
         if result.returncode != 0:
-            # make failed
-            error_message = result.stdout + "\n" + result.stderr
+            # make failed; output is only decoded when it is actually reported
+            error_message = (
+                result.stdout.decode("utf-8", errors="replace")
+                + "\n"
+                + result.stderr.decode("utf-8", errors="replace")
+            )
             output = {
                 "decision": "deny",
                 "reason": (
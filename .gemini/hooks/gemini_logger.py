@@ -5,20 +5,31 @@ import os
 import subprocess
 from datetime import datetime
 
+try:
+    import orjson
+
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
 # Configuration
 LOG_FILE = os.getenv("GEMINI_LOG_FILE", "gemini.log")
+RECORD_REMINDER_TMPL = (
+    "Please update CHANGELOG.md and add a one-line entry to journal/{today}.md "
+    "describing the changes you just made. Do not stop until these files are updated."
+)
 
 def get_modified_files():
     """Returns a list of modified files using git status."""
     try:
         result = subprocess.run(
             ["git", "status", "--porcelain"],
-            capture_output=True,
-            text=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
             check=True
         )
         files = []
-        for line in result.stdout.splitlines():
+        for line in result.stdout.decode("utf-8", errors="replace").splitlines():
             if line.strip():
                 # Format: 'M path/to/file' or '?? path/to/file'
                 files.append(line[3:].strip())
@@ -28,11 +39,11 @@ def get_modified_files():
 
 def main():
     try:
-        input_data = sys.stdin.read()
+        input_data = sys.stdin.buffer.read()
         if not input_data:
             data = {}
         else:
-            data = json.loads(input_data)
+            data = _loads(input_data)
 
         event = data.get("hook_event_name")
         output = {"decision": "allow"}
@@ -50,39 +61,38 @@ def main():
                 parts = content_obj.get("parts", [])
                 finish_reason = candidate.get("finishReason")
 
-                if parts or finish_reason:
+                payload = "".join(
+                    part if isinstance(part, str) else part.get("text", "")
+                    for part in parts
+                    if isinstance(part, (str, dict))
+                )
+                if finish_reason:
+                    payload += "\n\n"
+
+                # Empty streaming chunks don't need to touch the log file at all
+                if payload:
                     with open(LOG_FILE, "a", encoding="utf-8") as f:
-                        for part in parts:
-                            if isinstance(part, str):
-                                f.write(part)
-                            elif isinstance(part, dict) and "text" in part:
-                                f.write(part["text"])
-                        if finish_reason:
-                            f.write("\n\n")
+                        f.write(payload)
 
         elif event == "AfterAgent":
             modified_files = get_modified_files()
 
             # Check if there are changes other than journal/changelog
-            significant_changes = [
-                f for f in modified_files
-                if f != "CHANGELOG.md" and not f.startswith("journal/")
-            ]
-
-            today = datetime.now().strftime("%Y-%m-%d")
-            updates = [
-                f for f in modified_files
-                if f == "CHANGELOG.md" or f == f"journal/{today}.md"
-            ]
-
-            if significant_changes and not updates:
-                output = {
-                    "decision": "deny",
-                    "reason": (
-                        "Please update CHANGELOG.md and add a one-line entry to journal/" + today + ".md "
-                        "describing the changes you just made. Do not stop until these files are updated."
-                    )
-                }
+            significant_changes = any(
+                f != "CHANGELOG.md" and not f.startswith("journal/")
+                for f in modified_files
+            )
+
+            # Only look for record-keeping updates when there is something to record
+            if significant_changes:
+                today = datetime.now().strftime("%Y-%m-%d")
+                record_files = {"CHANGELOG.md", f"journal/{today}.md"}
+
+                if record_files.isdisjoint(modified_files):
+                    output = {
+                        "decision": "deny",
+                        "reason": RECORD_REMINDER_TMPL.format(today=today),
+                    }
 
         print(json.dumps(output))
 
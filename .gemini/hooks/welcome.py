@@ -23,9 +23,9 @@ def get_git_status():
         return "❌ Could not determine git status."
 
 def main():
-    # Read stdin though we don't strictly need it for this simple message
+    # Drain stdin without parsing it; this simple message doesn't use the payload
     try:
-        json.load(sys.stdin)
+        sys.stdin.buffer.read()
     except Exception:
         pass
 
@@ -1,17 +1,80 @@
 import os
-from datetime import datetime
+import time
+import atexit
+from collections import deque
 from textual.app import App, ComposeResult
 from textual.widgets import Header, Footer, Static, Label
 from textual.containers import VerticalScroll
 
 LOG_FILE = "key_test.log"
 
+
+class _LogWriter:
+    """
+    Keeps the log file open and appends lines to it in batches, so a burst
+    of keystrokes costs one write instead of an open/write/flush/close each.
+    """
+
+    def __init__(self, path: str, max_lines: int = 32, max_delay: float = 0.2):
+        self._path = path
+        self._max_lines = max_lines
+        self._max_delay = max_delay
+        self._file = None
+        self._buf: list[str] = []
+        self._last_flush = time.monotonic()
+
+    def write(self, line: str):
+        """Buffers a line, flushing once enough lines or time have accumulated."""
+        self._buf.append(line)
+        if (
+            len(self._buf) >= self._max_lines
+            or time.monotonic() - self._last_flush > self._max_delay
+        ):
+            self.flush()
+
+    def flush(self):
+        """Writes all buffered lines to the log file in a single call."""
+        self._last_flush = time.monotonic()
+        if not self._buf:
+            return
+        if self._file is None:
+            self._file = open(self._path, "a", buffering=1 << 16, encoding="utf-8")
+        self._file.write("".join(self._buf))
+        self._buf.clear()
+        # One flush per batch keeps the file tailable by gramit's --output-stream
+        self._file.flush()
+
+    def close(self):
+        """Flushes pending lines and closes the log file."""
+        self.flush()
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+_WRITER = _LogWriter(LOG_FILE)
+atexit.register(_WRITER.close)
+
+
+_last_sec = 0
+_last_prefix = ""
+
+
+def _timestamp() -> str:
+    """Returns 'HH:MM:SS.mmm', formatting the seconds part at most once per second."""
+    global _last_sec, _last_prefix
+    t = time.time()
+    sec = int(t)
+    if sec != _last_sec:
+        _last_prefix = time.strftime('%H:%M:%S', time.localtime(sec))
+        _last_sec = sec
+    return f"{_last_prefix}.{int((t - sec) * 1000):03d}"
+
+
 def log_key(key_info: str):
     """Logs key information to a file."""
-    with open(LOG_FILE, "a", encoding="utf-8") as f:
-        timestamp = datetime.now().strftime('%H:%M:%S.%f')[:-3]
-        f.write(f"{timestamp} - {key_info}\n")
-        f.flush()
+    timestamp = _timestamp()
+    _WRITER.write(f"{timestamp} - {key_info}\n")
 
 class KeyTestApp(App):
     """An app to test and display key presses and modifiers."""
@@ -57,9 +120,16 @@ class KeyTestApp(App):
     """
 
     def on_mount(self) -> None:
-        if os.path.exists(LOG_FILE):
+        try:
             os.remove(LOG_FILE)
+        except FileNotFoundError:
+            pass
+        self._history = deque(maxlen=15)
+        self._last_key = self.query_one("#last-key")
+        self._history_widget = self.query_one("#history")
         log_key("SYSTEM: Key Test App Started")
+        # Lines buffered during a quiet period still reach the file promptly
+        self.set_interval(0.2, _WRITER.flush)
 
     def compose(self) -> ComposeResult:
         yield Header()
@@ -91,24 +161,16 @@ class KeyTestApp(App):
         info = f"Key: {key_name} | Char: {repr(char)}"
         
         # Update UI
-        self.query_one("#last-key").update(info)
-        
-        history_widget = self.query_one("#history")
-        # Get current text, ignoring the widget's own container stuff if possible,
-        # but for this simple example we can just maintain a list.
-        if not hasattr(self, "_history_list"):
-            self._history_list = []
-        
-        self._history_list.insert(0, info)
-        self._history_list = self._history_list[:15]
-        
-        history_widget.update("\n".join(self._history_list))
+        self._last_key.update(info)
+        self._history.appendleft(info)
+        self._history_widget.update("\n".join(self._history))
         
         # Log for gramit to tail
         log_key(info)
 
         if key_name == "ctrl+q":
             log_key("SYSTEM: Exit requested via Ctrl+Q")
+            _WRITER.flush()
             self.exit()
 
 if __name__ == "__main__":
@@ -1,16 +1,32 @@
+import os
 import sys
 
 
+def reverse_line(line: bytes) -> bytes:
+    """Reverses a stripped line, working on raw bytes when it is plain ASCII."""
+    line = line.strip()
+    if line.isascii():
+        return line[::-1]
+    # Multi-byte characters must be reversed as text to stay valid UTF-8
+    return line.decode("utf-8", errors="replace")[::-1].encode("utf-8")
+
+
 def main():
-    print("Reverse Echo Bot started. Type something and press Enter.")
+    print("Reverse Echo Bot started. Type something and press Enter.", flush=True)
+    stdin_fd = sys.stdin.fileno()
+    stdout_fd = sys.stdout.fileno()
+    pending = b""
     while True:
         try:
-            line = sys.stdin.readline()
-            if not line:  # EOF
+            chunk = os.read(stdin_fd, 65536)
+            if not chunk:  # EOF
+                if pending:
+                    os.write(stdout_fd, reverse_line(pending) + b"\n")
                 break
-            reversed_line = line.strip()[::-1]
-            print(reversed_line)
-            sys.stdout.flush()  # Ensure output is sent immediately
+            # Every complete line read so far is answered with a single write
+            *lines, pending = (pending + chunk).split(b"\n")
+            if lines:
+                os.write(stdout_fd, b"".join(reverse_line(line) + b"\n" for line in lines))
         except KeyboardInterrupt:
             break
         except Exception as e:
@@ -1,5 +1,7 @@
 import os
-from datetime import datetime
+import time
+import asyncio
+import atexit
 from textual.app import App, ComposeResult
 from textual.widgets import Header, Footer, Input, Static
 from textual.containers import VerticalScroll
@@ -7,12 +9,53 @@ from textual.containers import VerticalScroll
 # Configuration
 LOG_FILE = "tui_echo.log"
 
-def log_message(sender: str, msg: str):
-    """Appends a clean message to the log file."""
-    with open(LOG_FILE, "a", encoding="utf-8") as f:
-        timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-        f.write(f"{timestamp} - {sender}: {msg}\n")
-        f.flush()
+
+class _LogWriter:
+    """
+    Keeps the log file open and appends lines to it in batches, so a burst
+    of messages costs one write instead of an open/write/flush/close each.
+    """
+
+    def __init__(self, path: str):
+        self._path = path
+        self._file = None
+
+    def write_batch(self, lines: list[str]):
+        """Appends several lines to the log file in a single write."""
+        if self._file is None:
+            self._file = open(self._path, "a", buffering=1 << 16, encoding="utf-8")
+        self._file.write("".join(lines))
+        # One flush per batch keeps the file tailable by gramit's --output-stream
+        self._file.flush()
+
+    def close(self):
+        """Closes the log file."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+_WRITER = _LogWriter(LOG_FILE)
+atexit.register(_WRITER.close)
+
+
+_last_sec = 0
+_last_stamp = ""
+
+
+def _timestamp() -> str:
+    """Returns 'YYYY-MM-DD HH:MM:SS', formatting it at most once per second."""
+    global _last_sec, _last_stamp
+    sec = int(time.time())
+    if sec != _last_sec:
+        _last_stamp = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(sec))
+        _last_sec = sec
+    return _last_stamp
+
+
+def format_log_line(sender: str, msg: str) -> str:
+    """Formats a clean log line for a chat message."""
+    return f"{_timestamp()} - {sender}: {msg}\n"
 
 class ChatBubble(Static):
     """A widget for a chat message bubble."""
@@ -103,10 +146,42 @@ class ChatApp(App):
 
     def on_mount(self) -> None:
         """Called when the app starts."""
-        if os.path.exists(LOG_FILE):
+        try:
             os.remove(LOG_FILE)
-        log_message("SYSTEM", "Application started.")
-        self.query_one(Input).focus()
+        except FileNotFoundError:
+            pass
+        self._log_q: asyncio.Queue[str | None] = asyncio.Queue()
+        self._log_task = asyncio.create_task(self._log_drain())
+        self.log_message("SYSTEM", "Application started.")
+        self._chat_log = self.query_one("#chat-log")
+        self._input = self.query_one(Input)
+        self._input.focus()
+
+    async def on_unmount(self) -> None:
+        """Drains pending log lines before the app exits."""
+        self._log_q.put_nowait(None)
+        await self._log_task
+
+    def log_message(self, sender: str, msg: str):
+        """Queues a log line without blocking the event loop on disk I/O."""
+        self._log_q.put_nowait(format_log_line(sender, msg))
+
+    async def _log_drain(self):
+        """Writes queued log lines in batches from a worker thread."""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = []
+            line = await self._log_q.get()
+            while line is not None:
+                batch.append(line)
+                if len(batch) >= 64 or self._log_q.empty():
+                    break
+                line = self._log_q.get_nowait()
+            if batch:
+                # run_in_executor skips the context copy to_thread makes per call
+                await loop.run_in_executor(None, _WRITER.write_batch, batch)
+            if line is None:
+                return
 
     def compose(self) -> ComposeResult:
         """Create child widgets for the app."""
@@ -122,18 +197,17 @@ class ChatApp(App):
             return
 
         # Clear input field
-        self.query_one(Input).value = ""
+        self._input.value = ""
 
         # 1. User Message
         bubble = ChatBubble("You", user_text)
         bubble.add_class("user-message")
-        chat_log = self.query_one("#chat-log")
-        chat_log.mount(bubble)
-        chat_log.scroll_end(animate=False)
-        log_message("USER", user_text)
+        self._chat_log.mount(bubble)
+        self._chat_log.scroll_end(animate=False)
+        self.log_message("USER", user_text)
 
         if user_text.lower() in ["quit", "exit"]:
-            log_message("SYSTEM", "User requested exit.")
+            self.log_message("SYSTEM", "User requested exit.")
             self.exit()
             return
 
@@ -148,11 +222,10 @@ class ChatApp(App):
         bubble = ChatBubble("Gramit Bot", response_text)
         bubble.add_class("bot-message")
 
-        chat_log = self.query_one("#chat-log")
-        chat_log.mount(bubble)
-        chat_log.scroll_end(animate=False)
+        self._chat_log.mount(bubble)
+        self._chat_log.scroll_end(animate=False)
 
-        log_message("BOT", response_text)
+        self.log_message("BOT", response_text)
 
 if __name__ == "__main__":
     app = ChatApp()
@@ -1,13 +1,16 @@
 import os
 import asyncio
 import argparse
+import importlib.util
 import logging
+import shlex
 import signal
-import sys
-from typing import Optional
+from typing import Any, Callable, Coroutine, List, Optional
 
 from dotenv import load_dotenv
 from telegram import Update, Bot
+from telegram.error import BadRequest, NetworkError
+from telegram.request import HTTPXRequest
 from telegram.ext import (
     Application,
     MessageHandler,
@@ -18,9 +21,30 @@ from telegram.ext import (
 from .orchestrator import Orchestrator
 from .router import OutputRouter
 from .telegram import InputRouter
-from .terminal import RESTORE_TERMINAL_SEQ
 from .utils import logger
 
+# Plain text messages are by far the most frequent update, so their combined
+# filter is built once and registered ahead of the command handler.
+TEXT_NOT_COMMAND = filters.TEXT & ~filters.COMMAND
+
+# Telegram holds getUpdates open for up to this many seconds when idle, so an
+# idle bot costs one HTTPS round-trip per interval instead of one every 10s.
+POLL_TIMEOUT = 50
+
+# Only plain messages are handled; asking for nothing else keeps Telegram from
+# sending (and PTB from parsing) edits, channel posts, reactions, etc.
+ALLOWED_UPDATES = [Update.MESSAGE]
+
+# HTTP/2 lets bursts of outgoing messages share one multiplexed keep-alive
+# connection; httpx only supports it when the optional h2 package is installed.
+SEND_HTTP_VERSION = "2" if importlib.util.find_spec("h2") else "1.1"
+
+STARTUP_MESSAGE_TMPL = (
+    "*Gramit started for command:* `{command}`\n"
+    "*Broadcasting to chat ID:* `{chat_id}`\n\n"
+    "Send `/help` for key shortcuts or `/quit` to terminate."
+)
+
 
 class GramitCLI:
     """
@@ -34,6 +58,7 @@ class GramitCLI:
         self.shutdown_event = asyncio.Event()
         self.application: Optional[Application] = None
         self.token: Optional[str] = None
+        self.chat_id: Optional[int] = None
 
     def get_parser(self) -> argparse.ArgumentParser:
         """
@@ -99,6 +124,28 @@ class GramitCLI:
         parser.add_argument("--line-mode", action="store_true", help="Enable line mode.")
         return parser
 
+    def parse_args(
+        self,
+        argv: Optional[List[str]] = None,
+        parser: Optional[argparse.ArgumentParser] = None,
+    ) -> argparse.Namespace:
+        """
+        Parses command line arguments.
+
+        Args:
+            argv: Arguments to parse. Defaults to sys.argv[1:].
+            parser: The parser to use. Defaults to a new one from get_parser().
+
+        Returns:
+            The parsed arguments, with the command as a plain list.
+        """
+        args = (parser or self.get_parser()).parse_args(argv)
+        # argparse.REMAINDER keeps a leading "--" separator as part of the command,
+        # so `gramit --chat-id 1 -- ls` would otherwise try to execute "--"
+        if args.command[:1] == ["--"]:
+            args.command = args.command[1:]
+        return args
+
     def setup_logging(self):
         """
         Configures logging based on the provided arguments.
@@ -112,9 +159,15 @@ class GramitCLI:
 
     async def error_handler(self, update: object, context: ContextTypes.DEFAULT_TYPE) -> None:
         """Log the error and send a telegram message to notify the developer."""
-        logger.error(f"Telegram error: {context.error}")
+        error = context.error
+        # Network blips during long polling are routine and retried by PTB itself
+        if isinstance(error, NetworkError) and not isinstance(error, BadRequest):
+            logger.debug("Transient Telegram network error: %s", error)
+        else:
+            logger.error("Telegram error: %s", error)
         if update:
-            logger.debug(f"Update that caused the error: {update}")
+            # Only the ID: repr(update) walks the whole nested message structure
+            logger.debug("Update that caused the error: %s", getattr(update, "update_id", None))
 
     async def _register_handler(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """A simple handler that prints information about any message it receives."""
@@ -138,48 +191,89 @@ class GramitCLI:
         
         async with self.application:
             await self.application.start()
-            await self.application.updater.start_polling()
+            await self.application.updater.start_polling(
+                timeout=POLL_TIMEOUT, allowed_updates=ALLOWED_UPDATES
+            )
             try:
-                await asyncio.Future()
+                await self.shutdown_event.wait()
             except asyncio.CancelledError:
                 pass
             finally:
                 await self.application.updater.stop()
                 await self.application.stop()
 
-    async def sender(self, bot: Bot, msg: str):
+    def make_sender(self, bot: Bot) -> Callable[[str], Coroutine[Any, Any, Any]]:
         """
-        Helper method to send a message to the authorized chat ID.
+        Builds the coroutine function used to send messages to the authorized chat ID.
+
+        The bound send method and chat ID are resolved once here rather than on
+        every outgoing message. Messages are sent as Markdown; if Telegram rejects
+        the markup (e.g. raw program output with an unbalanced `_` or backtick),
+        the message is resent once as plain text instead of being dropped.
+
+        Args:
+            bot: The bot used to send messages.
+
+        Returns:
+            An async function taking the message text.
         """
-        try:
-            return await bot.send_message(
-                chat_id=self.args.chat_id, text=msg, parse_mode="Markdown"
-            )
-        except Exception as e:
-            logger.error(f"Failed to send Telegram message: {e}")
+        send_message = bot.send_message
+        chat_id = self.chat_id
+
+        async def sender(msg: str):
+            try:
+                try:
+                    return await send_message(chat_id=chat_id, text=msg, parse_mode="Markdown")
+                except BadRequest as e:
+                    if "parse entities" not in str(e):
+                        raise
+                    return await send_message(chat_id=chat_id, text=msg)
+            except Exception as e:
+                logger.error("Failed to send Telegram message: %s", e)
+
+        return sender
 
     def _setup_signal_handlers(self):
         """
-        Registers signal handlers for graceful shutdown and window resizing.
+        Registers SIGINT/SIGTERM handlers that request a graceful shutdown.
+
+        This is the only signal path: the first signal sets the shutdown event,
+        and a second one cancels the main task in case the graceful path is stuck
+        (e.g. waiting on the network).
         """
         loop = asyncio.get_running_loop()
+        main_task = asyncio.current_task()
 
         def handle_shutdown():
+            if self.shutdown_event.is_set() and main_task:
+                main_task.cancel()
             self.shutdown_event.set()
 
         try:
-            loop.add_signal_handler(signal.SIGWINCH, self.orchestrator.resize)
             loop.add_signal_handler(signal.SIGINT, handle_shutdown)
             loop.add_signal_handler(signal.SIGTERM, handle_shutdown)
         except (NotImplementedError, AttributeError):
             pass
 
+    async def _terminate_on_shutdown(self, output_task: asyncio.Task):
+        """
+        Terminates the child once a shutdown is requested. The output router then
+        finishes on its own: it forwards what the child printed while exiting and
+        restores the terminal before the final Telegram flush.
+        """
+        await self.shutdown_event.wait()
+        await self.orchestrator.terminate()
+        if self.orchestrator.is_alive():
+            # The child couldn't be killed; stop waiting for it to exit
+            output_task.cancel()
+
     def _cleanup_signal_handlers(self):
         """
         Removes previously registered signal handlers.
         """
         loop = asyncio.get_running_loop()
         try:
+            loop.remove_signal_handler(signal.SIGWINCH)
             loop.remove_signal_handler(signal.SIGINT)
             loop.remove_signal_handler(signal.SIGTERM)
         except Exception:
@@ -191,7 +285,7 @@ class GramitCLI:
         """
         load_dotenv()
         parser = self.get_parser()
-        self.args = parser.parse_args()
+        self.args = self.parse_args(parser=parser)
         
         self.setup_logging()
         
@@ -200,24 +294,34 @@ class GramitCLI:
             print("Error: GRAMIT_TELEGRAM_TOKEN environment variable not set.")
             return
 
-        if self.args.register:
-            await self.run_registration()
-            return
-
-        if not self.args.chat_id:
-            parser.error("the following arguments are required: --chat-id (or GRAMIT_CHAT_ID env var)")
-        if not self.args.command:
-            parser.error("the following arguments are required: command")
+        if not self.args.register:
+            if not self.args.chat_id:
+                parser.error("the following arguments are required: --chat-id (or GRAMIT_CHAT_ID env var)")
+            if not self.args.command:
+                parser.error("the following arguments are required: command")
 
+        self._setup_signal_handlers()
+        try:
+            if self.args.register:
+                await self.run_registration()
+            else:
+                await self.run_bridge()
+        finally:
+            self._cleanup_signal_handlers()
+
+    async def run_bridge(self):
+        """
+        Runs the orchestrated command and bridges it with the authorized Telegram chat.
+        """
+        self.chat_id = int(self.args.chat_id)
         self.orchestrator = Orchestrator(self.args.command)
-        bot = Bot(self.token)
-
-        async def bot_sender(msg):
-            return await self.sender(bot, msg)
+        # A dedicated, small pool for sends keeps them off the long-polling connection
+        send_request = HTTPXRequest(connection_pool_size=8, http_version=SEND_HTTP_VERSION)
+        bot_sender = self.make_sender(Bot(self.token, request=send_request))
 
         input_router = InputRouter(
             orchestrator=self.orchestrator,
-            authorized_chat_ids=[int(self.args.chat_id)],
+            authorized_chat_ids=[self.chat_id],
             shutdown_event=self.shutdown_event,
             inject_enter=self.args.enter,
         )
@@ -229,58 +333,58 @@ class GramitCLI:
             mirror=self.args.mirror,
         )
 
+        # Updates from other chats are dropped by the filters, before any handler runs
+        authorized_chat = filters.Chat(chat_id=self.chat_id)
         self.application = Application.builder().token(self.token).build()
         self.application.add_handler(
-            MessageHandler(filters.TEXT & ~filters.COMMAND, input_router.handle_message)
+            MessageHandler(TEXT_NOT_COMMAND & authorized_chat, input_router.handle_message)
         )
         self.application.add_handler(
-            MessageHandler(filters.COMMAND, input_router.handle_command)
+            MessageHandler(filters.COMMAND & authorized_chat, input_router.handle_command)
         )
         self.application.add_error_handler(self.error_handler)
 
-        output_task = None
-
         try:
             async with self.application:
                 await self.application.start()
                 try:
-                    await self.application.updater.start_polling()
+                    # Messages sent while gramit wasn't running are stale input for
+                    # a program that didn't exist yet; skip them instead of replaying.
+                    await self.application.updater.start_polling(
+                        timeout=POLL_TIMEOUT,
+                        allowed_updates=ALLOWED_UPDATES,
+                        drop_pending_updates=True,
+                    )
                 except Exception as e:
                     await bot_sender(f"Error starting Telegram bot: `{e}`. Please check your token.")
                     return
 
                 await bot_sender(
-                    f"*Gramit started for command:* `{' '.join(self.args.command)}`\n"
-                    f"*Broadcasting to chat ID:* `{self.args.chat_id}`\n\n"
-                    "Send `/help` for key shortcuts or `/quit` to terminate."
+                    STARTUP_MESSAGE_TMPL.format(
+                        command=shlex.join(self.args.command), chat_id=self.chat_id
+                    )
                 )
 
                 await self.orchestrator.start()
-                self._setup_signal_handlers()
+                asyncio.get_running_loop().add_signal_handler(
+                    signal.SIGWINCH, self.orchestrator.schedule_resize
+                )
 
                 try:
                     self.output_router.prepare_terminal()
-                    output_task = asyncio.create_task(self.output_router.start())
-                    
-                    await asyncio.wait(
-                        [output_task, asyncio.create_task(self.shutdown_event.wait())],
-                        return_when=asyncio.FIRST_COMPLETED
-                    )
+                    async with asyncio.TaskGroup() as tg:
+                        output_task = tg.create_task(self.output_router.start())
+                        shutdown_task = tg.create_task(
+                            self._terminate_on_shutdown(output_task)
+                        )
+                        # A process exit ends the router; nothing is left to shut down
+                        output_task.add_done_callback(lambda _: shutdown_task.cancel())
                 finally:
-                    self._cleanup_signal_handlers()
-
-                    if self.orchestrator.is_alive():
-                        await self.orchestrator.shutdown()
+                    # Also closes the PTY and pidfd once the child has already exited
+                    await self.orchestrator.shutdown()
 
                     self.output_router.restore_terminal()
 
-                    if output_task and not output_task.done():
-                        output_task.cancel()
-                        try:
-                            await output_task
-                        except (asyncio.CancelledError, Exception):
-                            pass
-
                     if self.shutdown_event.is_set():
                         await bot_sender("Gramit application was interrupted. Goodbye!")
                     else:
@@ -289,48 +393,49 @@ class GramitCLI:
         except (KeyboardInterrupt, asyncio.CancelledError):
             pass
         except Exception as e:
-            logger.error(f"Gramit encountered an unhandled exception: {e}")
+            # Errors from the TaskGroup arrive wrapped; report the actual failure
+            while isinstance(e, ExceptionGroup):
+                e = e.exceptions[0]
+            logger.error("Gramit encountered an unhandled exception: %s", e)
             try:
                 await bot_sender(f"Gramit encountered an error: `{e}`. Shutting down.")
             except Exception:
                 pass
 
 
-# Global singleton for signal handling
-_cli_instance: Optional[GramitCLI] = None
-
-def run():
+def _event_loop_factory():
     """
-    Synchronous entrypoint that handles initial setup and signal registration.
+    Returns uvloop's event loop factory when the optional uvloop package is
+    installed, or None to use the default asyncio loop.
     """
-    global _cli_instance
-    _cli_instance = GramitCLI()
+    try:
+        import uvloop
+    except ImportError:
+        return None
+    return uvloop.new_event_loop
 
-    def signal_handler(sig, frame):
-        if _cli_instance.orchestrator and _cli_instance.orchestrator.is_alive():
-            try:
-                if _cli_instance.orchestrator._pid:
-                    os.kill(_cli_instance.orchestrator._pid, 9)
-            except Exception:
-                pass
 
-        if _cli_instance.output_router:
-            _cli_instance.output_router.restore_terminal()
-        else:
-            try:
-                os.write(sys.stdout.fileno(), RESTORE_TERMINAL_SEQ)
-            except Exception:
-                pass
-        sys.exit(1)
+def run():
+    """
+    Synchronous entrypoint for the gramit command.
 
-    signal.signal(signal.SIGINT, signal_handler)
-    signal.signal(signal.SIGTERM, signal_handler)
+    Signals are handled inside the event loop (see GramitCLI._setup_signal_handlers);
+    this only guarantees a last-resort cleanup if the loop exits abnormally.
+    """
+    cli = GramitCLI()
 
     try:
-        asyncio.run(_cli_instance.main())
+        asyncio.run(cli.main(), loop_factory=_event_loop_factory())
     except (KeyboardInterrupt, ValueError) as e:
         if isinstance(e, ValueError):
             print(f"Error: {e}")
     finally:
-        if _cli_instance.output_router:
-            _cli_instance.output_router.restore_terminal()
+        if cli.orchestrator and cli.orchestrator._pid:
+            try:
+                # The whole process group, in case the child left background jobs
+                os.killpg(cli.orchestrator._pid, signal.SIGKILL)
+            except Exception:
+                # ProcessLookupError: everything in it has already exited
+                pass
+        if cli.output_router:
+            cli.output_router.restore_terminal()
@@ -16,6 +16,7 @@ class AsyncDebouncer:
         interval: float,
         flush_callback: Callable[[List[T]], Coroutine[Any, Any, None]],
         max_buffer_size: int = 100,
+        drop_marker: T | None = None,
     ):
         """
         Initializes the AsyncDebouncer.
@@ -24,65 +25,125 @@ class AsyncDebouncer:
             interval: The time in seconds to wait for inactivity before flushing.
             flush_callback: An async function to call with the batch of items.
             max_buffer_size: Maximum number of items to buffer before forcing a flush.
+                While a flush is in progress, it also caps how many items are held
+                back; the oldest ones are dropped beyond it.
+            drop_marker: Optional item put at the front of the next batch in place
+                of dropped items, so the receiver can tell output is missing.
         """
         self._interval = interval
         self._flush_callback = flush_callback
         self._max_buffer_size = max_buffer_size
         self._buffer: List[T] = []
-        self._task: asyncio.Task | None = None
+        self._deadline = 0.0
+        self._timer: asyncio.TimerHandle | None = None
+        self._sending: asyncio.Task | None = None
+        self._drop_marker = drop_marker
+        self._dropped = 0
 
     async def push(self, item: T):
         """
-        Pushes an item into the debouncer buffer. 
+        Pushes an item into the debouncer buffer. See push_nowait().
+
+        Args:
+            item: The item to add to the buffer.
+        """
+        self.push_nowait(item)
+
+    def push_nowait(self, item: T):
+        """
+        Pushes an item into the debouncer buffer. Never waits on the flush callback,
+        so it can be called straight from event loop callbacks.
         
-        If the buffer reaches max_buffer_size, it flushes immediately.
-        Otherwise, it resets the flush timer.
+        If the buffer reaches max_buffer_size, the batch is handed to a background
+        send immediately. Otherwise, it pushes back the flush deadline; a single
+        timer per burst re-arms itself until the deadline stops moving.
+
+        Only one send is in flight at a time. Items pushed meanwhile are held, up to
+        max_buffer_size, and sent together as one batch once it completes.
 
         Args:
             item: The item to add to the buffer.
         """
         self._buffer.append(item)
+        loop = asyncio.get_running_loop()
+
+        if len(self._buffer) > self._max_buffer_size:
+            # Only possible while a send is in flight; keep the most recent items
+            del self._buffer[0]
+            self._dropped += 1
 
         if len(self._buffer) >= self._max_buffer_size:
-            # Force immediate flush if buffer is full
-            await self.flush()
+            # Force a flush if the buffer is full, without blocking the producer
+            self._send_buffer()
         else:
-            # Re-schedule the flush task (resetting the timer)
-            if self._task:
-                self._task.cancel()
-            try:
-                self._task = asyncio.create_task(self._wait_and_flush())
-            except RuntimeError:
-                # Event loop might be closing
-                pass
+            self._deadline = loop.time() + self._interval
+            if self._timer is None:
+                self._timer = loop.call_at(self._deadline, self._on_timer)
 
     async def flush(self):
         """
-        Immediately flushes the buffer, cancelling any pending flush task.
+        Immediately flushes the buffer, cancelling any pending flush timer.
+        Returns once the batch in flight and everything held behind it have gone
+        through the callback.
         """
-        if self._task:
-            self._task.cancel()
-            self._task = None
-
-        if self._buffer:
-            items_to_flush = self._buffer[:]
-            self._buffer.clear()
-            try:
-                await self._flush_callback(items_to_flush)
-            except Exception as e:
-                logger.error(f"AsyncDebouncer flush callback failed: {e}")
-
-    async def _wait_and_flush(self):
+        self._send_buffer()
+        while self._sending:
+            await self._sending
+
+    def _send_buffer(self):
         """
-        Waits for the specified interval, then flushes the buffer if it hasn't 
-        been cancelled.
+        Cancels the pending timer and hands the buffered batch to a background send.
+        If a send is already in flight, the items stay buffered; it picks them up
+        as a single batch when it completes.
         """
+        if self._timer:
+            self._timer.cancel()
+            self._timer = None
+
+        if not self._buffer or self._sending:
+            return
+
+        if self._dropped:
+            logger.warning(
+                "AsyncDebouncer dropped %d items while a flush was in progress",
+                self._dropped,
+            )
+            self._dropped = 0
+            if self._drop_marker is not None:
+                # Items are dropped from the front, so the gap is right before these
+                self._buffer.insert(0, self._drop_marker)
+
+        # Hand the list itself to the callback; push() only ever appends
+        items_to_flush, self._buffer = self._buffer, []
         try:
-            await asyncio.sleep(self._interval)
-            await self.flush()
-        except asyncio.CancelledError:
+            self._sending = asyncio.get_running_loop().create_task(
+                self._send(items_to_flush)
+            )
+        except RuntimeError:
+            # Event loop might be closing
             pass
+
+    async def _send(self, items: List[T]):
+        """
+        Calls the flush callback, then sends whatever was buffered in the meantime.
+        """
+        try:
+            await self._flush_callback(items)
         except Exception as e:
-            logger.error(f"AsyncDebouncer wait_and_flush encountered an error: {e}")
+            logger.error("AsyncDebouncer flush callback failed: %s", e)
         finally:
-            self._task = None
+            self._sending = None
+        self._send_buffer()
+
+    def _on_timer(self):
+        """
+        Timer callback. Re-arms itself if the deadline was pushed back since it
+        was scheduled, otherwise starts the flush; one task per flush, not per push.
+        """
+        loop = asyncio.get_running_loop()
+        if loop.time() < self._deadline:
+            self._timer = loop.call_at(self._deadline, self._on_timer)
+            return
+
+        self._timer = None
+        self._send_buffer()
@@ -1,11 +1,22 @@
 import os
 import pty
 import asyncio
-import shutil
 from typing import List
 
 from .utils import get_terminal_size, set_terminal_size, logger
 
+# Size of the reusable buffer PTY output is read into; one read drains a whole burst
+PTY_READ_SIZE = 65536
+
+
+def _wake_up(waiter: asyncio.Future):
+    """
+    Reader callback resolving a readiness future. The fd can be reported ready
+    again before the awaiting coroutine gets to remove the reader.
+    """
+    if not waiter.done():
+        waiter.set_result(None)
+
 
 class Orchestrator:
     """
@@ -25,13 +36,24 @@ class Orchestrator:
         self._command = command
         self._pid: int | None = None
         self._master_fd: int | None = None
+        self._resize_timer: asyncio.TimerHandle | None = None
+        self._winsize: tuple[int, int] | None = None
+        self._write_buffer = bytearray()
+        self._drain_waiter: asyncio.Future | None = None
+        self._read_view = memoryview(bytearray(PTY_READ_SIZE))
+        self._pidfd: int | None = None
+        self._exited = asyncio.Event()
 
     async def read(self, max_bytes: int) -> bytes:
         """
         Reads data from the child process's stdout.
 
+        Readiness is awaited through the event loop (add_reader) instead of
+        blocking a worker thread on os.read. Data is read into a preallocated
+        buffer, so only the bytes actually received are copied out.
+
         Args:
-            max_bytes: The maximum number of bytes to read.
+            max_bytes: The maximum number of bytes to read (capped at PTY_READ_SIZE).
 
         Returns:
             The data read from stdout as bytes.
@@ -39,23 +61,89 @@ class Orchestrator:
         if self._master_fd is None:
             return b""
 
+        fd = self._master_fd
+        view = self._read_view[:max_bytes]
         loop = asyncio.get_running_loop()
-        return await loop.run_in_executor(None, os.read, self._master_fd, max_bytes)
+        while True:
+            try:
+                n = os.readv(fd, [view])
+                return view[:n].tobytes()
+            except BlockingIOError:
+                pass
+
+            readable = loop.create_future()
+            loop.add_reader(fd, _wake_up, readable)
+            try:
+                await readable
+            finally:
+                loop.remove_reader(fd)
 
     async def write(self, data: str | bytes):
         """
         Writes data to the child process's stdin.
 
+        The data is written directly when the PTY accepts it; anything left over
+        is drained by an add_writer callback, and this coroutine returns once all
+        pending data has been written.
+
         Args:
             data: The string or bytes data to write.
         """
-        if self._master_fd is not None:
-            if isinstance(data, str):
-                encoded_data = data.encode("utf-8")
-            else:
-                encoded_data = data
+        if self._master_fd is None:
+            return
+
+        if isinstance(data, str):
+            data = data.encode("utf-8")
+        self._write_buffer += data
+
+        if self._drain_waiter is None:
+            self._flush_write_buffer()
+            if not self._write_buffer:
+                return
             loop = asyncio.get_running_loop()
-            await loop.run_in_executor(None, os.write, self._master_fd, encoded_data)
+            self._drain_waiter = loop.create_future()
+            loop.add_writer(self._master_fd, self._on_pty_writable)
+
+        # Shielded so one cancelled writer doesn't fail the others sharing the waiter
+        await asyncio.shield(self._drain_waiter)
+
+    def _flush_write_buffer(self):
+        """
+        Writes as much of the pending write buffer as the PTY accepts without blocking.
+        """
+        try:
+            written = os.write(self._master_fd, self._write_buffer)
+        except BlockingIOError:
+            return
+        except OSError:
+            self._write_buffer.clear()
+            raise
+        del self._write_buffer[:written]
+
+    def _on_pty_writable(self):
+        """
+        Callback executed when the PTY master can accept more input.
+        Drains the write buffer and wakes up writers once it is empty.
+        """
+        waiter = self._drain_waiter
+        try:
+            self._flush_write_buffer()
+        except OSError as e:
+            self._stop_draining()
+            if waiter and not waiter.done():
+                waiter.set_exception(e)
+            return
+
+        if not self._write_buffer:
+            self._stop_draining()
+            if waiter and not waiter.done():
+                waiter.set_result(None)
+
+    def _stop_draining(self):
+        """Unregisters the PTY writer callback and forgets the drain waiter."""
+        if self._master_fd is not None:
+            asyncio.get_running_loop().remove_writer(self._master_fd)
+        self._drain_waiter = None
 
     def _prepare_child_process(self):
         """
@@ -63,22 +151,24 @@ class Orchestrator:
         This method is called after pty.fork().
         """
         try:
-            cmd = self._command[0]
-            # If the command is not an absolute path and not in PATH,
-            # but exists in the current directory, prepend ./
-            if not os.path.isabs(cmd) and os.path.sep not in cmd:
-                if not shutil.which(cmd) and os.path.exists(cmd):
-                    self._command[0] = os.path.join(os.curdir, cmd)
-            
             # Security: Scrub sensitive environment variables before execvp
             env = os.environ.copy()
             env.pop("GRAMIT_TELEGRAM_TOKEN", None)
             env.pop("GRAMIT_CHAT_ID", None)
-            
-            os.execvpe(self._command[0], self._command, env)
+
+            cmd = self._command[0]
+            try:
+                os.execvpe(cmd, self._command, env)
+            except FileNotFoundError:
+                # If the command is a bare name that isn't in PATH,
+                # but exists in the current directory, retry with ./
+                if os.path.sep in cmd or not os.path.exists(cmd):
+                    raise
+                self._command[0] = os.path.join(os.curdir, cmd)
+                os.execvpe(self._command[0], self._command, env)
         except OSError as e:
             # If execvp fails, we need to exit the child process
-            logger.error(f"FATAL: execvp failed: {e}")
+            logger.error("FATAL: execvp failed: %s", e)
             os._exit(1)
 
     async def start(self) -> int:
@@ -98,12 +188,55 @@ class Orchestrator:
             # In the parent process
             self._pid = pid
             self._master_fd = master_fd
+            # All PTY I/O goes through the event loop, so it must never block
+            os.set_blocking(master_fd, False)
             
             # Set initial size explicitly on the master FD
             set_terminal_size(self._master_fd, cols, rows)
+            self._winsize = (cols, rows)
+
+            self._watch_child_exit()
 
             return pid
 
+    def _watch_child_exit(self):
+        """
+        Registers a pidfd for the child so its exit is delivered by the event loop.
+        Falls back to waitpid polling where pidfd_open is unavailable (non-Linux or
+        kernels older than 5.3).
+        """
+        try:
+            self._pidfd = os.pidfd_open(self._pid)
+        except (AttributeError, OSError) as e:
+            logger.debug("pidfd_open unavailable, falling back to waitpid: %s", e)
+            return
+
+        asyncio.get_running_loop().add_reader(self._pidfd, self._on_child_exit)
+
+    def _close_pidfd(self):
+        """Unregisters and closes the child's pidfd, if any."""
+        if self._pidfd is None:
+            return
+        try:
+            asyncio.get_running_loop().remove_reader(self._pidfd)
+        except RuntimeError:
+            # No running loop (e.g. during interpreter teardown)
+            pass
+        os.close(self._pidfd)
+        self._pidfd = None
+
+    def _on_child_exit(self):
+        """
+        Callback executed when the child's pidfd becomes readable, i.e. it exited.
+        Reaps the child and wakes up anyone waiting for it.
+        """
+        self._close_pidfd()
+        try:
+            os.waitpid(self._pid, os.WNOHANG)
+        except ChildProcessError:
+            pass
+        self._exited.set()
+
     def resize(self):
         """
         Updates the child PTY's window size to match the current terminal size.
@@ -111,13 +244,42 @@ class Orchestrator:
         if self._master_fd is None:
             return
 
-        cols, rows = get_terminal_size()
-        set_terminal_size(self._master_fd, cols, rows)
+        size = get_terminal_size()
+        # SIGWINCH also fires for moves and focus changes that keep the size
+        if size == self._winsize:
+            return
+
+        set_terminal_size(self._master_fd, *size)
+        self._winsize = size
+
+    def schedule_resize(self, delay: float = 0.03):
+        """
+        Schedules a resize, coalescing bursts of requests into a single one.
+
+        Dragging a terminal window emits dozens of SIGWINCH per second; only the
+        size in effect once they settle needs to reach the child PTY.
+
+        Args:
+            delay: Quiet period in seconds before the resize is applied.
+        """
+        if self._resize_timer:
+            self._resize_timer.cancel()
+
+        loop = asyncio.get_running_loop()
+        self._resize_timer = loop.call_later(delay, self._apply_scheduled_resize)
+
+    def _apply_scheduled_resize(self):
+        """Timer callback that applies a previously scheduled resize."""
+        self._resize_timer = None
+        self.resize()
 
     def is_alive(self) -> bool:
         """Checks if the child process is currently running."""
-        if not self._pid:
+        if not self._pid or self._exited.is_set():
             return False
+        if self._pidfd is not None:
+            # Exit is reported by _on_child_exit, so nothing to poll
+            return True
         try:
             # waitpid with WNOHANG returns (0, 0) if the process is still running
             return os.waitpid(self._pid, os.WNOHANG) == (0, 0)
@@ -125,18 +287,68 @@ class Orchestrator:
             # This occurs if the process is already reaped
             return False
 
+    async def wait(self):
+        """
+        Waits until the child process exits, without polling.
+
+        With a pidfd the exit is signalled by the event loop; otherwise the
+        blocking waitpid runs in an executor thread.
+        """
+        if not self._pid:
+            return
+
+        if self._pidfd is not None or self._exited.is_set():
+            await self._exited.wait()
+            return
+
+        loop = asyncio.get_running_loop()
+        try:
+            await loop.run_in_executor(None, os.waitpid, self._pid, 0)
+        except ChildProcessError:
+            # Already reaped, e.g. by is_alive() or shutdown()
+            pass
+        self._exited.set()
+
+    async def terminate(self):
+        """
+        Terminates the child process, escalating to SIGKILL if it doesn't exit
+        promptly. The PTY stays open, so whatever the child printed on its way
+        out can still be read; shutdown() closes it.
+        """
+        if not self._pid:
+            return
+
+        try:
+            # pty.fork() makes the child a session and process group leader, so
+            # signalling the group also reaches anything it spawned, even once
+            # the child itself has exited
+            os.killpg(self._pid, 15)  # SIGTERM
+            # Give it a moment to terminate gracefully
+            try:
+                await asyncio.wait_for(self.wait(), timeout=0.1)
+            except TimeoutError:
+                os.killpg(self._pid, 9)  # SIGKILL
+                await asyncio.wait_for(self.wait(), timeout=1.0)
+        except (ProcessLookupError, TimeoutError):
+            # The whole group is already gone, or stuck beyond our control
+            pass
+
     async def shutdown(self):
         """Terminates the child process and closes the PTY."""
-        if self.is_alive() and self._pid:
-            try:
-                os.kill(self._pid, 15)  # SIGTERM
-                # Give it a moment to terminate gracefully
-                await asyncio.sleep(0.1)
-                if self.is_alive():
-                    os.kill(self._pid, 9)  # SIGKILL
-            except ProcessLookupError:
-                # Process already died
-                pass
+        if self._resize_timer:
+            self._resize_timer.cancel()
+            self._resize_timer = None
+
+        await self.terminate()
+        self._close_pidfd()
+
+        if self._drain_waiter:
+            waiter = self._drain_waiter
+            self._stop_draining()
+            self._write_buffer.clear()
+            # The child is gone, so pending input is dropped rather than failing writers
+            if not waiter.done():
+                waiter.set_result(None)
 
         if self._master_fd:
             try:
@@ -1,10 +1,14 @@
 import asyncio
+import ctypes
 import io
 import os
 import re
+import select
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from typing import Callable, Coroutine, Any, Optional
 
-from .orchestrator import Orchestrator
+from .orchestrator import Orchestrator, PTY_READ_SIZE
 from .debouncer import AsyncDebouncer
 from .terminal import TerminalManager
 from .utils import (
@@ -13,46 +17,172 @@ from .utils import (
 
 # Regex for matching ANSI escape sequences (CSI, OSC, etc.)
 # This is a broad regex to capture most common sequences
-ANSI_RE = re.compile(r'\x1b(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])')
+# It works on bytes, so PTY output is only decoded once, right before sending.
+ANSI_RE = re.compile(rb'\x1b(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])')
+
+# Shown wherever output had to be left out of a Telegram message
+TRIM_MARKER = "\n\n... [Output trimmed due to size] ...\n\n"
+
+
+def _incomplete_utf8_tail(data: bytearray) -> int:
+    """
+    Returns how many trailing bytes of data are an incomplete UTF-8 character,
+    so a chunk boundary never splits a multi-byte character.
+    """
+    for i in range(1, min(4, len(data)) + 1):
+        byte = data[-i]
+        if byte < 0x80:
+            return 0
+        if byte >= 0xC0:
+            # Lead byte: 110xxxxx, 1110xxxx or 11110xxx
+            needed = 2 if byte < 0xE0 else 3 if byte < 0xF0 else 4
+            return i if i < needed else 0
+    return 0
+
+
+class _DirectoryWatch:
+    """
+    Sets an asyncio.Event whenever an entry of a directory is created, written,
+    moved or deleted, using Linux inotify through libc.
+    """
+
+    # IN_MODIFY | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+    _MASK = 0x002 | 0x008 | 0x040 | 0x080 | 0x100 | 0x200
+
+    def __init__(self, directory: str, changed: asyncio.Event):
+        """
+        Starts watching a directory.
+
+        Args:
+            directory: The directory to watch.
+            changed: Event to set when something in the directory changes.
+
+        Raises:
+            AttributeError: If libc has no inotify support (non-Linux).
+            OSError: If the watch cannot be created.
+        """
+        libc = ctypes.CDLL(None, use_errno=True)
+        # IN_NONBLOCK and IN_CLOEXEC share their values with O_NONBLOCK and O_CLOEXEC
+        fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        if libc.inotify_add_watch(fd, os.fsencode(directory), self._MASK) < 0:
+            err = ctypes.get_errno()
+            os.close(fd)
+            raise OSError(err, f"inotify_add_watch failed for {directory}")
+
+        self._fd = fd
+        self._changed = changed
+        asyncio.get_running_loop().add_reader(fd, self._on_events)
+
+    def _on_events(self):
+        """Discards the pending inotify events and signals a change."""
+        try:
+            while os.read(self._fd, 4096):
+                pass
+        except BlockingIOError:
+            pass
+        self._changed.set()
+
+    def close(self):
+        """Stops watching and releases the inotify descriptor."""
+        asyncio.get_running_loop().remove_reader(self._fd)
+        os.close(self._fd)
 
 
 class FileTailer:
     """
     Asynchronously tails a file for new content.
+
+    On Linux, the tailer sleeps until inotify reports a change in the file's
+    directory; elsewhere it polls every poll_interval.
     """
 
+    # With inotify, how often to re-check liveness when nothing changes
+    IDLE_RECHECK_INTERVAL = 1.0
+
     def __init__(self, file_path: str, poll_interval: float = 0.1):
         """
         Initializes the FileTailer.
 
         Args:
             file_path: Path to the file to tail.
-            poll_interval: Interval in seconds to poll for new data.
+            poll_interval: Interval in seconds to poll for new data when
+                inotify is unavailable.
         """
         self._file_path = file_path
         self._poll_interval = poll_interval
         self._stop_event = asyncio.Event()
+        self._changed = asyncio.Event()
+        self._watch: Optional[_DirectoryWatch] = None
+        self._pool: Optional[ThreadPoolExecutor] = None
+
+    def _start_watch(self):
+        """Watches the file's directory with inotify, falling back to polling."""
+        directory = os.path.dirname(os.path.abspath(self._file_path))
+        try:
+            self._watch = _DirectoryWatch(directory, self._changed)
+        except (AttributeError, OSError) as e:
+            logger.debug("inotify unavailable for %s, polling instead: %s", directory, e)
+
+    def _stop_watch(self):
+        """Releases the inotify watch, if any."""
+        if self._watch:
+            self._watch.close()
+            self._watch = None
+
+    async def _wait_for_change(self):
+        """
+        Sleeps until the watched directory changes, stop() is called, or the
+        idle re-check interval passes. Without inotify, sleeps poll_interval.
+        """
+        if self._watch is None:
+            await asyncio.sleep(self._poll_interval)
+            return
+
+        try:
+            await asyncio.wait_for(self._changed.wait(), self.IDLE_RECHECK_INTERVAL)
+        except TimeoutError:
+            pass
+        # Cleared before the caller re-reads, so later changes are never missed
+        self._changed.clear()
 
     async def read_new(self, orchestrator: Orchestrator):
         """
-        A generator that yields new content appended to the file.
+        A generator that yields new content appended to the file, as bytes.
         Wait for the file to be created if it doesn't exist yet.
 
         Args:
             orchestrator: The orchestrator whose process lifecycle we follow.
         """
+        self._start_watch()
+        # Reads are sequential, so one private thread is enough and keeps a slow
+        # filesystem from tying up the loop's shared default executor
+        self._pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="gramit-tail")
+        try:
+            async for data in self._follow(orchestrator):
+                yield data
+        finally:
+            self._stop_watch()
+            self._pool.shutdown(wait=False)
+
+    async def _follow(self, orchestrator: Orchestrator):
+        """
+        Implements read_new once the directory watch (if any) is in place.
+        """
         # Wait for file to exist OR process to die
         while not os.path.exists(self._file_path):
             if self._stop_event.is_set() or not orchestrator.is_alive():
                 return
-            await asyncio.sleep(self._poll_interval)
+            await self._wait_for_change()
 
         loop = asyncio.get_running_loop()
         
         # We'll reopen the file if it's replaced/rotated
         while not self._stop_event.is_set() and orchestrator.is_alive():
             try:
-                with open(self._file_path, "r", encoding="utf-8", errors="replace") as f:
+                # Binary mode: output is decoded once, when it is flushed to Telegram
+                with open(self._file_path, "rb") as f:
                     # Seek to end initially
                     f.seek(0, os.SEEK_END)
                     last_pos = f.tell()
@@ -73,22 +203,23 @@ class FileTailer:
                             break # File moved/deleted, wait for it to reappear
 
                         # Read available data
-                        data = await loop.run_in_executor(None, f.read, 4096)
+                        data = await loop.run_in_executor(self._pool, f.read, PTY_READ_SIZE)
                         
                         if not data:
-                            await asyncio.sleep(self._poll_interval)
+                            await self._wait_for_change()
                             continue
                         
                         yield data
                         last_pos = f.tell()
             except Exception as e:
-                logger.debug(f"FileTailer encountered an error reading {self._file_path}: {e}")
+                logger.debug("FileTailer encountered an error reading %s: %s", self._file_path, e)
                 await asyncio.sleep(self._poll_interval)
                 continue
 
     def stop(self):
         """Stops the file tailing process."""
         self._stop_event.set()
+        self._changed.set()
 
 
 class OutputRouter:
@@ -124,10 +255,14 @@ class OutputRouter:
         self._orchestrator = orchestrator
         self._sender = sender
         self._mode = mode
-        self._buffer = ""
-        self._mirror_buffer = b""
+        self._buffer = bytearray()
+        self._mirror_buffer = bytearray()
         self._debouncer = AsyncDebouncer(
-            debounce_interval, self._flush_buffer, max_buffer_size=max_buffer_lines
+            debounce_interval,
+            self._flush_buffer,
+            max_buffer_size=max_buffer_lines,
+            # Chunks dropped while a slow send is in flight are marked like a trim
+            drop_marker=TRIM_MARKER.encode("ascii"),
         )
         self._output_stream = output_stream
         self._mirror = mirror
@@ -135,6 +270,13 @@ class OutputRouter:
         self._terminal_manager = TerminalManager(enabled=mirror)
         self._mirror_timer: Optional[asyncio.TimerHandle] = None
         self._mirror_debounce_interval = 0.04 # 40ms for better TUI quiescence (approx 25fps)
+        self._mirror_idle_interval = 0.004 # Snappy echo when output starts after a pause
+        self._mirror_watermark = 65536 # Flush right away once this much is pending
+        self._last_mirror_flush = 0.0
+        # Looked up once; the callbacks below run for every keystroke and flush
+        self._stdin_fd: Optional[int] = None
+        self._stdout_fd: Optional[int] = None
+        self._read_view = memoryview(bytearray(PTY_READ_SIZE))
 
     async def start(self):
         """
@@ -145,19 +287,31 @@ class OutputRouter:
         try:
             if self._output_stream:
                 self._tailer = FileTailer(self._output_stream)
-                async for data in self._tailer.read_new(self._orchestrator):
-                    await self._handle_new_data(data, telegram_only=True)
+                exit_watch = asyncio.create_task(self._stop_tailer_on_exit())
+                try:
+                    async for data in self._tailer.read_new(self._orchestrator):
+                        await self._handle_new_data(data, telegram_only=True)
+                finally:
+                    exit_watch.cancel()
             else:
                 # In standard mode, the readers (callbacks) do the work.
                 # We just wait for the process to exit.
-                while self._orchestrator.is_alive():
-                    await asyncio.sleep(0.1)
+                await self._orchestrator.wait()
+                await self._drain_pty()
         except asyncio.CancelledError:
             pass
         finally:
             self._cleanup_readers()
             await self._final_flush()
 
+    async def _stop_tailer_on_exit(self):
+        """
+        Stops the file tailer as soon as the child exits, so an idle tailer
+        doesn't have to notice the exit on its own.
+        """
+        await self._orchestrator.wait()
+        self._tailer.stop()
+
     def _setup_readers(self):
         """
         Configures asynchronous loop readers for the PTY master and local stdin.
@@ -168,12 +322,12 @@ class OutputRouter:
             loop.add_reader(master_fd, self._on_pty_readable)
 
         if self._mirror:
-            import sys
             try:
                 stdin_fd = sys.stdin.fileno()
                 loop.add_reader(stdin_fd, self._on_stdin_readable)
+                self._stdin_fd = stdin_fd
             except (Exception, io.UnsupportedOperation) as e:
-                logger.debug(f"Could not add reader for stdin: {e}")
+                logger.debug("Could not add reader for stdin: %s", e)
 
     def _cleanup_readers(self):
         """
@@ -184,11 +338,9 @@ class OutputRouter:
         if master_fd is not None:
             loop.remove_reader(master_fd)
         
-        import sys
-        try:
-            loop.remove_reader(sys.stdin.fileno())
-        except Exception:
-            pass
+        if self._stdin_fd is not None:
+            loop.remove_reader(self._stdin_fd)
+            self._stdin_fd = None
             
         if self._tailer:
             self._tailer.stop()
@@ -198,46 +350,81 @@ class OutputRouter:
         Performs a final flush of all remaining data in both mirror and Telegram buffers.
         """
         if self._buffer:
-            await self._debouncer.push(self._buffer)
-            self._buffer = ""
+            self._debouncer.push_nowait(bytes(self._buffer))
+            self._buffer.clear()
         if self._mirror_buffer:
             self._flush_mirror()
+        # The local terminal shouldn't stay raw for the Telegram round-trip
+        self.restore_terminal()
         await self._debouncer.flush()
 
+    async def _drain_pty(self):
+        """
+        Routes any output still pending on the PTY master once the child has exited,
+        so a process that writes and exits immediately isn't cut short.
+        """
+        master_fd = self._orchestrator._master_fd
+        if master_fd is None:
+            return
+
+        try:
+            while select.select([master_fd], [], [], 0)[0]:
+                data = self._read_pty(master_fd)
+                if not data:
+                    break
+                await self._handle_new_data(data, mirror_only=bool(self._output_stream))
+        except (OSError, ValueError) as e:
+            logger.debug("Stopped draining PTY: %s", e)
+
+    def _read_pty(self, master_fd: int) -> memoryview:
+        """
+        Reads everything currently available on the PTY (up to PTY_READ_SIZE)
+        into the reusable buffer.
+
+        The returned view is only valid until the next read, so it must be
+        consumed (mirrored, decoded) before control returns to the loop.
+        """
+        n = os.readv(master_fd, [self._read_view])
+        return self._read_view[:n]
+
     def _on_pty_readable(self):
         """
         Callback executed when the PTY master file descriptor is ready for reading.
         Reads data and routes it to the appropriate destinations.
         """
         try:
-            data = os.read(self._orchestrator._master_fd, 4096)
+            data = self._read_pty(self._orchestrator._master_fd)
             if not data:
                 return
-            
+
+            # Consume the view right away: both destinations copy straight from
+            # the read buffer, so the raw bytes are never copied on their own.
+            if self._mirror:
+                self._route_to_mirror(data)
             # If output_stream is set, PTY data should be mirror-only
-            asyncio.create_task(self._handle_new_data(data, mirror_only=bool(self._output_stream)))
+            if not self._output_stream:
+                self._route_to_telegram(data)
         except Exception as e:
-            logger.debug(f"Error reading from PTY: {e}")
+            logger.debug("Error reading from PTY: %s", e)
 
     def _on_stdin_readable(self):
         """
         Callback executed when the local stdin file descriptor is ready for reading.
         Reads input and writes it to the PTY orchestrated process.
         """
-        import sys
         try:
-            data = os.read(sys.stdin.fileno(), 4096)
+            data = os.read(self._stdin_fd, 4096)
             if data:
                 asyncio.create_task(self._orchestrator.write(data))
         except Exception as e:
-            logger.debug(f"Error reading from stdin: {e}")
+            logger.debug("Error reading from stdin: %s", e)
 
-    async def _handle_new_data(self, data: str | bytes, mirror_only: bool = False, telegram_only: bool = False):
+    async def _handle_new_data(self, data: bytes | memoryview, mirror_only: bool = False, telegram_only: bool = False):
         """
         Routes incoming data to the local terminal mirror and/or the Telegram debouncer.
 
         Args:
-            data: The incoming string or byte data.
+            data: The incoming bytes.
             mirror_only: If True, only routes to the local terminal.
             telegram_only: If True, only routes to the Telegram debouncer.
         """
@@ -245,119 +432,106 @@ class OutputRouter:
             self._route_to_mirror(data)
             
         if not mirror_only:
-            await self._route_to_telegram(data)
+            self._route_to_telegram(data)
 
-    def _route_to_mirror(self, data: str | bytes):
+    def _route_to_mirror(self, data: bytes | memoryview):
         """
         Appends data to the mirror buffer and schedules an asynchronous flush.
 
         Args:
             data: The data to mirror locally.
         """
-        if isinstance(data, str):
-            self._mirror_buffer += data.encode('utf-8', errors='replace')
-        else:
-            self._mirror_buffer += data
+        self._mirror_buffer += data
         self._schedule_mirror_flush()
 
-    async def _route_to_telegram(self, data: str | bytes):
+    def _route_to_telegram(self, data: bytes | memoryview):
         """
         Appends data to the Telegram buffer and pushes complete ANSI-safe chunks to the debouncer.
 
         Args:
             data: The data to route to Telegram.
         """
-        if isinstance(data, bytes):
-            text = data.decode('utf-8', errors='replace')
-        else:
-            text = data
-
-        self._buffer += text
+        self._buffer += data
         safe_chunk = self._extract_safe_chunk()
         if safe_chunk:
-            await self._debouncer.push(safe_chunk)
+            self._debouncer.push_nowait(safe_chunk)
 
     def _schedule_mirror_flush(self):
-        """Schedules a flush to the local terminal with debouncing."""
+        """
+        Schedules a flush to the local terminal, batching adaptively.
+
+        A full buffer is flushed at once. Output arriving after a pause is
+        flushed almost immediately, so typing echo stays snappy. While output
+        keeps flowing, it is flushed at most every _mirror_debounce_interval;
+        a pending flush is never pushed back, so a steady stream can't starve
+        the mirror.
+        """
+        if len(self._mirror_buffer) >= self._mirror_watermark:
+            if self._mirror_timer:
+                self._mirror_timer.cancel()
+            self._flush_mirror()
+            return
+
         if self._mirror_timer:
-            self._mirror_timer.cancel()
-        
+            return
+
         try:
             loop = asyncio.get_running_loop()
-            self._mirror_timer = loop.call_later(
-                self._mirror_debounce_interval, self._flush_mirror
-            )
         except RuntimeError:
             # Loop might be closing
             self._flush_mirror()
+            return
+
+        if loop.time() - self._last_mirror_flush > 0.05:
+            delay = self._mirror_idle_interval
+        else:
+            delay = self._mirror_debounce_interval
+        self._mirror_timer = loop.call_later(delay, self._flush_mirror)
 
     def _flush_mirror(self):
         """Flushes the mirror_buffer directly to local stdout."""
+        self._mirror_timer = None
         if not self._mirror_buffer:
             return
 
-        import sys
         try:
-            os.write(sys.stdout.fileno(), self._mirror_buffer)
-            self._mirror_buffer = b""
+            if self._stdout_fd is None:
+                self._stdout_fd = sys.stdout.fileno()
+            written = os.write(self._stdout_fd, self._mirror_buffer)
+            del self._mirror_buffer[:written]
+            if self._mirror_buffer:
+                # Short write (e.g. interrupted by a signal): retry the rest
+                self._schedule_mirror_flush()
         except Exception as e:
-            logger.debug(f"Failed to flush mirror buffer: {e}")
+            logger.debug("Failed to flush mirror buffer: %s", e)
         finally:
-            self._mirror_timer = None
+            try:
+                self._last_mirror_flush = asyncio.get_running_loop().time()
+            except RuntimeError:
+                pass
 
-    def _extract_safe_chunk(self) -> str:
+    def _extract_safe_chunk(self) -> bytes:
         """
-        Extracts part of self._buffer that is safe to send (no partial ANSI),
-        leaving any partial sequence in the buffer.
+        Extracts part of self._buffer that is safe to send (no partial ANSI
+        sequence or UTF-8 character), leaving the partial tail in the buffer.
         """
         if not self._buffer:
-            return ""
-
-        # Find the last ESC character
-        last_esc = self._buffer.rfind("\x1b")
-        
-        if last_esc != -1:
-            potential_seq = self._buffer[last_esc:]
-            # If the sequence at the end is incomplete AND it doesn't 
-            # already contain a complete sequence or extra text after a 
-            # possible sequence, we treat it as partial.
-            # A sequence is "truly partial" if it's just ESC or ESC+[...
-            # and doesn't have a terminator yet.
-            
-            # Use search to see if there's any COMPLETE sequence in the potential suffix
-            match = ANSI_RE.search(potential_seq)
-            
-            if match:
-                # There is a complete sequence. 
-                # Is there anything AFTER it?
-                end_pos = match.end()
-                if end_pos < len(potential_seq):
-                    # There is text after the complete sequence. 
-                    # Does THAT text contain another (partial) ESC?
-                    remaining = potential_seq[end_pos:]
-                    next_esc = remaining.rfind("\x1b")
-                    if next_esc != -1:
-                        # There's another ESC in the remainder
-                        split_point = last_esc + end_pos + next_esc
-                        to_write = self._buffer[:split_point]
-                        self._buffer = self._buffer[split_point:]
-                        return to_write
-                    else:
-                        # No more ESCs, it's all safe
-                        pass
-                else:
-                    # Sequence ends exactly at buffer end, all safe
-                    pass
-            else:
-                # No complete sequence found in the suffix starting with ESC.
-                # If it's short, it's likely a partial sequence.
-                if len(potential_seq) < 32:
-                    to_write = self._buffer[:last_esc]
-                    self._buffer = self._buffer[last_esc:]
-                    return to_write
-        
-        to_write = self._buffer
-        self._buffer = ""
+            return b""
+
+        split_point = len(self._buffer)
+
+        # Only the last ESC can start a partial sequence
+        last_esc = self._buffer.rfind(b"\x1b")
+        if last_esc != -1 and not ANSI_RE.match(self._buffer, last_esc):
+            # No complete sequence at the last ESC.
+            # If it's short, it's likely a partial sequence.
+            if split_point - last_esc < 32:
+                split_point = last_esc
+        if split_point == len(self._buffer):
+            split_point -= _incomplete_utf8_tail(self._buffer)
+
+        to_write = bytes(self._buffer[:split_point])
+        del self._buffer[:split_point]
         return to_write
 
     def prepare_terminal(self):
@@ -368,15 +542,19 @@ class OutputRouter:
         """Restores the terminal to its original state."""
         self._terminal_manager.restore_terminal()
 
-    async def _flush_buffer(self, items: list[str]):
+    async def _flush_buffer(self, items: list[bytes]):
         """Processes collected chunks, strips ANSI, and sends to Telegram."""
         if not items:
             return
 
-        full_text = "".join(items)
-        full_text = ANSI_RE.sub('', full_text)
+        raw = b"".join(items)
+        # Plain output has no ESC at all; a memchr scan is far cheaper than the regex
+        if b"\x1b" in raw:
+            raw = ANSI_RE.sub(b"", raw)
+        full_text = raw.decode("utf-8", errors="replace")
 
-        lines = [line.strip() for line in full_text.split("\n") if line.strip()]
+        # Each line is stripped once; filter(None) drops the blank ones
+        lines = list(filter(None, map(str.strip, full_text.split("\n"))))
         if not lines:
             return
             
@@ -387,11 +565,11 @@ class OutputRouter:
             half_limit = (MAX_TELEGRAM_MSG // 2) - 100
             full_message = (
                 full_message[:half_limit]
-                + "\n\n... [Output trimmed due to size] ...\n\n"
+                + TRIM_MARKER
                 + full_message[-half_limit:]
             )
 
         try:
             await self._sender(full_message)
         except Exception as e:
-            logger.error(f"Failed to send Telegram message: {e}")
+            logger.error("Failed to send Telegram message: %s", e)
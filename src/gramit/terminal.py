@@ -71,7 +71,7 @@ class TerminalManager:
         try:
             os.write(sys.stdout.fileno(), (CLEAR_SCREEN + HOME_CURSOR).encode("ascii"))
         except Exception as e:
-            logger.debug(f"Failed to clear terminal: {e}")
+            logger.debug("Failed to clear terminal: %s", e)
 
     def restore_terminal(self):
         """
@@ -82,12 +82,14 @@ class TerminalManager:
             return
 
         self._restored = True
+        termios_restored = False
         
         try:
             fd = sys.stdin.fileno()
             if self._old_settings:
                 try:
                     termios.tcsetattr(fd, termios.TCSADRAIN, self._old_settings)
+                    termios_restored = True
                 except Exception:
                     pass
         except (Exception, io.UnsupportedOperation):
@@ -96,7 +98,7 @@ class TerminalManager:
         try:
             os.write(sys.stdout.fileno(), RESTORE_TERMINAL_SEQ)
         except Exception as e:
-            logger.debug(f"Failed to write restoration sequence: {e}")
+            logger.debug("Failed to write restoration sequence: %s", e)
         
         # Settle time and flush
         time.sleep(0.1)
@@ -106,6 +108,10 @@ class TerminalManager:
         except Exception:
             pass
 
+        if termios_restored:
+            return
+
+        # Last resort when the saved settings couldn't be put back; forks stty
         try:
             subprocess.run(["stty", "sane"], check=False, capture_output=True)
         except Exception:
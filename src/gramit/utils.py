@@ -7,6 +7,9 @@ import logging
 # Configure logging for the project
 logger = logging.getLogger("gramit")
 
+# struct winsize layout for TIOCSWINSZ; compiled once since resizes run on every SIGWINCH
+_WINSIZE = struct.Struct("HHHH")
+
 
 def get_terminal_size(fallback=(80, 24)):
     """
@@ -23,7 +26,7 @@ def get_terminal_size(fallback=(80, 24)):
         size = shutil.get_terminal_size(fallback=fallback)
         return size.columns, size.lines
     except Exception as e:
-        logger.debug(f"Failed to get terminal size: {e}")
+        logger.debug("Failed to get terminal size: %s", e)
         return fallback
 
 
@@ -37,7 +40,7 @@ def set_terminal_size(fd: int, cols: int, rows: int):
         rows: Number of rows.
     """
     try:
-        winsize = struct.pack("HHHH", rows, cols, 0, 0)
+        winsize = _WINSIZE.pack(rows, cols, 0, 0)
         fcntl.ioctl(fd, termios.TIOCSWINSZ, winsize)
     except Exception as e:
-        logger.debug(f"Failed to set terminal size on fd {fd}: {e}")
+        logger.debug("Failed to set terminal size on fd %s: %s", fd, e)
@@ -36,3 +36,13 @@ def test_log_file_argument():
     # Test custom
     args = parser.parse_args(["--log-file", "test.log", "--chat-id", "123", "ls"])
     assert args.log_file == "test.log"
+
+def test_command_after_separator():
+    cli = GramitCLI()
+    args = cli.parse_args(["--chat-id", "123", "--", "ls", "-la"])
+    assert args.command == ["ls", "-la"]
+
+def test_command_keeps_inner_separator():
+    cli = GramitCLI()
+    args = cli.parse_args(["--chat-id", "123", "ssh", "host", "--", "uptime"])
+    assert args.command == ["ssh", "host", "--", "uptime"]
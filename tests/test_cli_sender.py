@@ -0,0 +1,56 @@
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+from telegram.error import BadRequest
+
+from gramit.cli import GramitCLI
+
+
+@pytest.mark.asyncio
+async def test_sender_targets_authorized_chat():
+    """
+    Tests that the pre-built sender sends to the authorized chat ID.
+    """
+    cli = GramitCLI()
+    cli.chat_id = 12345
+    bot = MagicMock()
+    bot.send_message = AsyncMock()
+
+    sender = cli.make_sender(bot)
+    await sender("hello")
+
+    bot.send_message.assert_awaited_once_with(
+        chat_id=12345, text="hello", parse_mode="Markdown"
+    )
+
+
+@pytest.mark.asyncio
+async def test_sender_swallows_send_errors():
+    """
+    Tests that a failing send is logged rather than raised.
+    """
+    cli = GramitCLI()
+    cli.chat_id = 12345
+    bot = MagicMock()
+    bot.send_message = AsyncMock(side_effect=Exception("network down"))
+
+    sender = cli.make_sender(bot)
+    assert await sender("hello") is None
+
+
+@pytest.mark.asyncio
+async def test_sender_falls_back_to_plain_text_on_markdown_error():
+    """
+    Tests that output Telegram cannot parse as Markdown is resent as plain text.
+    """
+    cli = GramitCLI()
+    cli.chat_id = 12345
+    bot = MagicMock()
+    bot.send_message = AsyncMock(
+        side_effect=[BadRequest("Can't parse entities: can't find end of the entity"), None]
+    )
+
+    sender = cli.make_sender(bot)
+    await sender("snake_case output")
+
+    assert bot.send_message.await_count == 2
+    bot.send_message.assert_awaited_with(chat_id=12345, text="snake_case output")
@@ -45,10 +45,11 @@ async def test_debouncer_flushes_when_buffer_full():
     await debouncer.push("item2")
     flush_callback.assert_not_called()
 
-    # The 3rd item should trigger an immediate flush
+    # The 3rd item should trigger an immediate flush, in the background
     await debouncer.push("item3")
+    await asyncio.sleep(0)
 
-    # Callback should have been called immediately without waiting for interval
+    # Callback should have been called without waiting for interval
     flush_callback.assert_awaited_once_with(["item1", "item2", "item3"])
 
 @pytest.mark.asyncio
@@ -62,11 +63,13 @@ async def test_debouncer_multiple_flushes():
     # First batch (via size)
     await debouncer.push("1")
     await debouncer.push("2")
+    await asyncio.sleep(0)
     assert mock_callback.call_count == 1
     
     # Second batch (via size)
     await debouncer.push("3")
     await debouncer.push("4")
+    await asyncio.sleep(0)
     assert mock_callback.call_count == 2
     
     # Third batch (via timeout)
@@ -77,3 +80,75 @@ async def test_debouncer_multiple_flushes():
     mock_callback.assert_any_call(["1", "2"])
     mock_callback.assert_any_call(["3", "4"])
     mock_callback.assert_any_call(["5"])
+
+@pytest.mark.asyncio
+async def test_debouncer_burst_creates_one_flush_task():
+    """
+    Tests that a burst of pushes creates no task until the interval of
+    inactivity has passed, and then flushes everything at once.
+    """
+    mock_callback = AsyncMock()
+    debouncer = AsyncDebouncer(interval=0.05, flush_callback=mock_callback)
+
+    await debouncer.push("a")
+    for item in "bcd":
+        await asyncio.sleep(0.02)
+        await debouncer.push(item)
+        assert debouncer._sending is None
+
+    mock_callback.assert_not_called()
+    await asyncio.sleep(0.1)
+    mock_callback.assert_awaited_once_with(["a", "b", "c", "d"])
+    assert debouncer._timer is None
+
+@pytest.mark.asyncio
+async def test_debouncer_push_does_not_wait_for_slow_callback():
+    """
+    Tests that a full buffer doesn't block the producer on the flush callback,
+    and that batches still reach the callback in order.
+    """
+    sent = []
+    release = asyncio.Event()
+
+    async def slow_callback(items):
+        await release.wait()
+        sent.append(items)
+
+    debouncer = AsyncDebouncer(interval=1.0, flush_callback=slow_callback, max_buffer_size=2)
+
+    for item in "abcd":
+        await asyncio.wait_for(debouncer.push(item), timeout=0.1)
+
+    assert sent == []
+    release.set()
+    await debouncer.flush()
+    assert sent == [["a", "b"], ["c", "d"]]
+
+@pytest.mark.asyncio
+async def test_debouncer_merges_and_caps_items_held_during_send():
+    """
+    Tests that only one send is in flight, and that items pushed meanwhile are
+    capped to max_buffer_size, marked where dropped, and sent as a single batch
+    once it completes.
+    """
+    sent = []
+    release = asyncio.Event()
+
+    async def slow_callback(items):
+        await release.wait()
+        sent.append(items)
+
+    debouncer = AsyncDebouncer(
+        interval=1.0, flush_callback=slow_callback, max_buffer_size=3, drop_marker="..."
+    )
+
+    for item in "abcdefghij":
+        await debouncer.push(item)
+        await asyncio.sleep(0)
+
+    assert sent == []
+    release.set()
+    await debouncer.flush()
+    # The oldest held items are replaced by the marker; the rest go out together
+    assert sent == [["a", "b", "c"], ["...", "h", "i", "j"]]
+    assert debouncer._sending is None
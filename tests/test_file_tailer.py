@@ -41,9 +41,9 @@ async def test_file_tailer_reads_new_appends(tmp_path):
     # Wait for tailer to finish
     await asyncio.wait_for(tailer_task, timeout=2.0)
     
-    assert results == ["new line 1\n", "new line 2\n"]
+    assert results == [b"new line 1\n", b"new line 2\n"]
     # Verify it didn't read 'initial content'
-    assert "initial content\n" not in results
+    assert b"initial content\n" not in results
 
 @pytest.mark.asyncio
 async def test_file_tailer_waits_for_file_creation(tmp_path):
@@ -80,4 +80,38 @@ async def test_file_tailer_waits_for_file_creation(tmp_path):
         f.flush()
     
     await asyncio.wait_for(tailer_task, timeout=2.0)
-    assert results == ["first line\n"]
+    assert results == [b"first line\n"]
+
+@pytest.mark.asyncio
+async def test_file_tailer_wakes_on_change_without_polling(tmp_path):
+    """
+    Tests that, with inotify, appended data is picked up right away even
+    with a poll interval far longer than the test.
+    """
+    test_file = tmp_path / "watched.log"
+    test_file.write_text("")
+    tailer = FileTailer(str(test_file), poll_interval=60)
+
+    from unittest.mock import MagicMock
+    mock_orchestrator = MagicMock()
+    mock_orchestrator.is_alive.return_value = True
+
+    results = []
+
+    async def run_tailer():
+        async for line in tailer.read_new(mock_orchestrator):
+            results.append(line)
+            tailer.stop()
+
+    tailer_task = asyncio.create_task(run_tailer())
+    await asyncio.sleep(0.05)
+    if tailer._watch is None:
+        tailer.stop()
+        await tailer_task
+        pytest.skip("inotify is not available on this platform")
+
+    with open(test_file, "a") as f:
+        f.write("ping\n")
+
+    await asyncio.wait_for(tailer_task, timeout=0.5)
+    assert results == [b"ping\n"]
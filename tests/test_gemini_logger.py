@@ -103,3 +103,18 @@ def test_newline_stripping_trailing(clean_log):
     # Actually current behavior would be "Hello\n\nWorld\n\n" because \n\n is added to each chunk.
     # Correct behavior: "Hello\nWorld\n\n"
     assert content == "Hello\nWorld\n\n"
+
+def test_empty_chunk_does_not_touch_log(clean_log):
+    chunk = {
+        "hook_event_name": "AfterModel",
+        "llm_response": {
+            "candidates": [
+                {
+                    "content": {"parts": [{"text": ""}]},
+                    "finishReason": None
+                }
+            ]
+        }
+    }
+    run_hook(chunk)
+    assert not os.path.exists(LOG_FILE)
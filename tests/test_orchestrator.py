@@ -1,3 +1,5 @@
+import asyncio
+import os
 import pytest
 from unittest.mock import patch
 from gramit.orchestrator import Orchestrator
@@ -73,3 +75,176 @@ async def test_orchestrator_resize():
         
         mock_get_size.assert_called_once()
         mock_set_size.assert_called_once_with(999, 100, 50)
+
+@pytest.mark.asyncio
+async def test_orchestrator_resize_skips_unchanged_size():
+    """
+    Tests that resize() doesn't touch the PTY when the size hasn't changed.
+    """
+    orchestrator = Orchestrator(["/bin/ls"])
+    orchestrator._master_fd = 999
+
+    with patch("gramit.orchestrator.get_terminal_size") as mock_get_size, \
+         patch("gramit.orchestrator.set_terminal_size") as mock_set_size:
+
+        mock_get_size.return_value = (100, 50)
+        orchestrator.resize()
+        orchestrator.resize()
+        mock_set_size.assert_called_once_with(999, 100, 50)
+
+        mock_get_size.return_value = (120, 50)
+        orchestrator.resize()
+        mock_set_size.assert_called_with(999, 120, 50)
+        assert mock_set_size.call_count == 2
+
+@pytest.mark.asyncio
+async def test_orchestrator_wait_returns_on_exit():
+    """
+    Tests that wait() returns once the child process exits, without polling.
+    """
+    orchestrator = Orchestrator(["/bin/sh", "-c", "exit 0"])
+    await orchestrator.start()
+
+    await asyncio.wait_for(orchestrator.wait(), timeout=2.0)
+    assert not orchestrator.is_alive()
+
+    await orchestrator.shutdown()
+
+@pytest.mark.asyncio
+async def test_orchestrator_schedule_resize_coalesces():
+    """
+    Tests that a burst of scheduled resizes results in a single resize.
+    """
+    orchestrator = Orchestrator(["/bin/ls"])
+    orchestrator._master_fd = 999
+
+    with patch("gramit.orchestrator.get_terminal_size") as mock_get_size, \
+         patch("gramit.orchestrator.set_terminal_size") as mock_set_size:
+
+        mock_get_size.return_value = (120, 40)
+        for _ in range(10):
+            orchestrator.schedule_resize(delay=0.01)
+
+        mock_set_size.assert_not_called()
+        await asyncio.sleep(0.05)
+
+        mock_set_size.assert_called_once_with(999, 120, 40)
+
+@pytest.mark.asyncio
+async def test_orchestrator_write_drains_when_fd_is_full():
+    """
+    Tests that a write larger than the kernel buffer is drained via the event
+    loop and completes once the reader catches up.
+    """
+    read_fd, write_fd = os.pipe()
+    os.set_blocking(write_fd, False)
+    orchestrator = Orchestrator(["/bin/ls"])
+    orchestrator._master_fd = write_fd
+
+    payload = b"x" * (1 << 20)
+
+    async def consume():
+        received = bytearray()
+        loop = asyncio.get_running_loop()
+        while len(received) < len(payload):
+            received += await loop.run_in_executor(None, os.read, read_fd, 65536)
+        return bytes(received)
+
+    reader = asyncio.create_task(consume())
+    await asyncio.wait_for(orchestrator.write(payload), timeout=5.0)
+    assert await asyncio.wait_for(reader, timeout=5.0) == payload
+    assert orchestrator._drain_waiter is None
+
+    os.close(read_fd)
+    os.close(write_fd)
+
+@pytest.mark.asyncio
+async def test_orchestrator_shutdown_escalates_to_sigkill():
+    """
+    Tests that shutdown() kills a child that ignores SIGTERM and returns
+    as soon as it is gone.
+    """
+    orchestrator = Orchestrator(["/bin/sh", "-c", "trap '' TERM; sleep 10"])
+    await orchestrator.start()
+    await asyncio.sleep(0.1)
+    assert orchestrator.is_alive()
+
+    await asyncio.wait_for(orchestrator.shutdown(), timeout=2.0)
+    assert not orchestrator.is_alive()
+    assert orchestrator._pidfd is None
+
+@pytest.mark.asyncio
+async def test_orchestrator_shutdown_kills_process_group():
+    """
+    Tests that shutdown() also terminates processes spawned by the child,
+    even ones that survive the SIGHUP sent when the PTY closes.
+    """
+    orchestrator = Orchestrator(["/bin/sh", "-c", "trap '' HUP; sleep 10 & echo $!; wait"])
+    await orchestrator.start()
+
+    output = b""
+    while b"\n" not in output:
+        output += await asyncio.wait_for(orchestrator.read(1024), timeout=2.0)
+    grandchild = int(output.split()[0])
+
+    await orchestrator.shutdown()
+    await asyncio.sleep(0.1)
+
+    # Gone, or a zombie waiting for init to reap it
+    try:
+        with open(f"/proc/{grandchild}/stat") as f:
+            state = f.read().rsplit(")", 1)[1].split()[0]
+    except FileNotFoundError:
+        state = "gone"
+    assert state in ("gone", "Z")
+
+@pytest.mark.asyncio
+async def test_orchestrator_terminate_keeps_exit_output_readable():
+    """
+    Tests that terminate() leaves the PTY open, so what the child prints
+    while handling SIGTERM can still be read.
+    """
+    orchestrator = Orchestrator(
+        ["/bin/sh", "-c", "trap 'echo saved; exit 0' TERM; echo ready; while :; do sleep 0.01; done"]
+    )
+    await orchestrator.start()
+
+    output = b""
+    while b"ready" not in output:
+        output += await asyncio.wait_for(orchestrator.read(1024), timeout=2.0)
+
+    await orchestrator.terminate()
+    assert not orchestrator.is_alive()
+
+    output = b""
+    while b"saved" not in output:
+        output += await asyncio.wait_for(orchestrator.read(1024), timeout=2.0)
+
+    await orchestrator.shutdown()
+
+@pytest.mark.asyncio
+async def test_orchestrator_shutdown_kills_group_after_child_exited():
+    """
+    Tests that shutdown() still signals the process group when the child
+    itself has already exited, leaving a background process behind.
+    """
+    orchestrator = Orchestrator(["/bin/sh", "-c", "trap '' HUP; sleep 10 & echo $!"])
+    await orchestrator.start()
+
+    output = b""
+    while b"\n" not in output:
+        output += await asyncio.wait_for(orchestrator.read(1024), timeout=2.0)
+    grandchild = int(output.split()[0])
+
+    await asyncio.wait_for(orchestrator.wait(), timeout=2.0)
+    assert not orchestrator.is_alive()
+
+    await orchestrator.shutdown()
+    await asyncio.sleep(0.1)
+
+    try:
+        with open(f"/proc/{grandchild}/stat") as f:
+            state = f.read().rsplit(")", 1)[1].split()[0]
+    except FileNotFoundError:
+        state = "gone"
+    assert state in ("gone", "Z")
@@ -14,7 +14,9 @@ async def test_standard_mode_pty_to_telegram():
         orchestrator = MagicMock()
         orchestrator._master_fd = r_fd
         # Let it run then exit
-        orchestrator.is_alive.side_effect = [True, True, False]
+        async def process_exit():
+            await asyncio.sleep(0.2)
+        orchestrator.wait = AsyncMock(side_effect=process_exit)
         orchestrator.read = AsyncMock(return_value=b"STANDARD CONTENT")
     
         sender = AsyncMock()
@@ -30,7 +32,7 @@ async def test_standard_mode_pty_to_telegram():
         router._restore_terminal = MagicMock()
     
         # Mock debouncer push to see what's sent to Telegram
-        router._debouncer.push = AsyncMock()
+        router._debouncer.push_nowait = MagicMock()
     
         # Write data initially
         os.write(w_fd, b"STANDARD CONTENT\n")
@@ -41,14 +43,14 @@ async def test_standard_mode_pty_to_telegram():
         # Give event loop time to process the pipe data
         await asyncio.sleep(0.1)
         
-        # Wait for completion (since is_alive returns False eventually)
+        # Wait for completion (since the process exits eventually)
         await task
             
         # Data should have been pushed to debouncer
-        router._debouncer.push.assert_awaited()
+        router._debouncer.push_nowait.assert_called()
         # Check content of pushed data
-        full_sent = "".join(call.args[0] for call in router._debouncer.push.await_args_list)
-        assert "STANDARD CONTENT" in full_sent
+        full_sent = b"".join(call.args[0] for call in router._debouncer.push_nowait.call_args_list)
+        assert b"STANDARD CONTENT" in full_sent
     finally:
         os.close(r_fd)
         os.close(w_fd)
@@ -65,6 +67,9 @@ async def test_output_stream_bypasses_pty_for_telegram():
         orchestrator = MagicMock()
         orchestrator._master_fd = r_fd
         orchestrator.is_alive.side_effect = [True, True, True, False]
+        async def process_exit():
+            await asyncio.sleep(0.2)
+        orchestrator.wait = AsyncMock(side_effect=process_exit)
     
         sender = AsyncMock()
     
@@ -83,13 +88,13 @@ async def test_output_stream_bypasses_pty_for_telegram():
         with patch("gramit.router.FileTailer") as MockTailer:
             tailer_instance = MockTailer.return_value
             async def mock_read_new(orch):
-                yield "FILE CONTENT"
+                yield b"FILE CONTENT"
                 # Keep it alive for a bit
                 await asyncio.sleep(0.05)
             tailer_instance.read_new = mock_read_new
     
             # Mock debouncer push
-            router._debouncer.push = AsyncMock()
+            router._debouncer.push_nowait = MagicMock()
     
             # Start router
             task = asyncio.create_task(router.start())
@@ -101,15 +106,15 @@ async def test_output_stream_bypasses_pty_for_telegram():
             await task
     
             # Assertions
-            pushed_calls = [call.args[0] for call in router._debouncer.push.await_args_list]
-            pushed_data = "".join(pushed_calls)
+            pushed_calls = [call.args[0] for call in router._debouncer.push_nowait.call_args_list]
+            pushed_data = b"".join(pushed_calls)
             
             # The file content should be pushed
-            assert "FILE CONTENT" in pushed_data
+            assert b"FILE CONTENT" in pushed_data
             
             # The PTY content should NOT be in the pushed_data
             # IF THIS FAILS, THE BUG IS REPRODUCED
-            assert "PTY CONTENT" not in pushed_data
+            assert b"PTY CONTENT" not in pushed_data
     finally:
         os.close(r_fd)
         os.close(w_fd)
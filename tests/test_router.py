@@ -17,8 +17,10 @@ async def test_output_router_line_mode():
     try:
         mock_orchestrator = MagicMock()
         mock_orchestrator._master_fd = r_fd
-        # Simulate being alive until we write our data
-        mock_orchestrator.is_alive.side_effect = [True, True, False]
+        # Simulate the process running for a while, then exiting
+        async def process_exit():
+            await asyncio.sleep(0.2)
+        mock_orchestrator.wait = AsyncMock(side_effect=process_exit)
         
         mock_sender = AsyncMock()
     
@@ -39,7 +41,7 @@ async def test_output_router_line_mode():
         # Wait for processing
         await asyncio.sleep(0.1)
         
-        # Stop router by making is_alive return False
+        # Router stops once the process exits
         await task
     
         # Assertions
@@ -62,7 +64,7 @@ async def test_output_router_handles_quick_exit():
     try:
         mock_orchestrator = MagicMock()
         mock_orchestrator._master_fd = r_fd
-        mock_orchestrator.is_alive.side_effect = [True, False]
+        mock_orchestrator.wait = AsyncMock()
         
         mock_sender = AsyncMock()
     
@@ -123,32 +125,32 @@ def test_extract_safe_chunk_with_partial_ansi():
     router = OutputRouter(MagicMock(), MagicMock())
     
     # Complete sequence
-    router._buffer = "hello\x1b[31mworld"
+    router._buffer = bytearray(b"hello\x1b[31mworld")
     chunk = router._extract_safe_chunk()
-    assert chunk == "hello\x1b[31mworld"
-    assert router._buffer == ""
+    assert chunk == b"hello\x1b[31mworld"
+    assert router._buffer == b""
     
     # Partial sequence at end
-    router._buffer = "hello\x1b["
+    router._buffer = bytearray(b"hello\x1b[")
     chunk = router._extract_safe_chunk()
-    assert chunk == "hello"
-    assert router._buffer == "\x1b["
+    assert chunk == b"hello"
+    assert router._buffer == b"\x1b["
     
     # Append more to complete it
-    router._buffer += "31m"
+    router._buffer += b"31m"
     chunk = router._extract_safe_chunk()
-    assert chunk == "\x1b[31m"
-    assert router._buffer == ""
+    assert chunk == b"\x1b[31m"
+    assert router._buffer == b""
 
 def test_extract_safe_chunk_with_esc_at_end():
     """
     Tests that an ESC character at the very end of the buffer is treated as partial.
     """
     router = OutputRouter(MagicMock(), MagicMock())
-    router._buffer = "data\x1b"
+    router._buffer = bytearray(b"data\x1b")
     chunk = router._extract_safe_chunk()
-    assert chunk == "data"
-    assert router._buffer == "\x1b"
+    assert chunk == b"data"
+    assert router._buffer == b"\x1b"
 
 def test_extract_safe_chunk_long_partial_sequence():
     """
@@ -157,9 +159,106 @@ def test_extract_safe_chunk_long_partial_sequence():
     """
     router = OutputRouter(MagicMock(), MagicMock())
     # > 32 characters starting with \x1b
-    long_garbage = "\x1b" + "a" * 40
-    router._buffer = long_garbage
+    long_garbage = b"\x1b" + b"a" * 40
+    router._buffer = bytearray(long_garbage)
     chunk = router._extract_safe_chunk()
     # Heuristic in code is 32 chars
     assert chunk == long_garbage
-    assert router._buffer == ""
+    assert router._buffer == b""
+
+def test_extract_safe_chunk_keeps_partial_utf8_character():
+    """
+    Tests that a multi-byte character split across reads is held back until
+    it is complete, instead of being decoded as two replacement characters.
+    """
+    router = OutputRouter(MagicMock(), MagicMock())
+    encoded = "año".encode("utf-8")
+    router._buffer = bytearray(encoded[:2])
+    chunk = router._extract_safe_chunk()
+    assert chunk == b"a"
+    assert router._buffer == encoded[1:2]
+
+    router._buffer += encoded[2:]
+    chunk = router._extract_safe_chunk()
+    assert chunk.decode("utf-8") == "ño"
+    assert router._buffer == b""
+
+@pytest.mark.asyncio
+async def test_mirror_flush_is_not_starved_by_steady_output():
+    """
+    Tests that a steady stream of output still reaches the local terminal
+    at the streaming interval, and that a full buffer is flushed at once.
+    """
+    router = OutputRouter(MagicMock(), AsyncMock(), mirror=True)
+    router._mirror_debounce_interval = 0.05
+
+    with patch("gramit.router.os.write", side_effect=lambda fd, data: len(data)) as mock_write:
+        # Output after a pause is flushed almost immediately
+        router._route_to_mirror(b"first")
+        await asyncio.sleep(0.02)
+        mock_write.assert_called_once()
+
+        # Chunks every 10ms keep flowing, but must not push the flush back forever
+        for _ in range(10):
+            router._route_to_mirror(b"chunk")
+            await asyncio.sleep(0.01)
+        assert mock_write.call_count >= 2
+
+        mock_write.reset_mock()
+        router._route_to_mirror(b"x" * router._mirror_watermark)
+        mock_write.assert_called_once()
+
+@pytest.mark.asyncio
+async def test_mirror_flush_retries_short_writes():
+    """
+    Tests that bytes left over by a short write to stdout are written later
+    instead of being dropped.
+    """
+    router = OutputRouter(MagicMock(), AsyncMock(), mirror=True)
+    written = bytearray()
+
+    def short_write(fd, data):
+        chunk = bytes(data[:3])
+        written.extend(chunk)
+        return len(chunk)
+
+    with patch("gramit.router.os.write", side_effect=short_write):
+        router._route_to_mirror(b"abcdefgh")
+        await asyncio.sleep(0.2)
+
+    assert written == b"abcdefgh"
+    assert router._mirror_buffer == b""
+
+@pytest.mark.asyncio
+async def test_output_router_marks_output_dropped_during_slow_send():
+    """
+    Tests that output dropped while a slow Telegram send is in flight is
+    replaced by a trim marker instead of silently disappearing.
+    """
+    sent = []
+    release = asyncio.Event()
+
+    async def slow_sender(text):
+        await release.wait()
+        sent.append(text)
+
+    router = OutputRouter(
+        orchestrator=MagicMock(),
+        sender=slow_sender,
+        debounce_interval=0.01,
+        max_buffer_lines=5,
+        mirror=False,
+    )
+
+    for i in range(20):
+        router._route_to_telegram(f"line {i}\n".encode())
+        await asyncio.sleep(0)
+
+    release.set()
+    await router._debouncer.flush()
+
+    assert len(sent) == 2
+    assert sent[0] == "\n".join(f"line {i}" for i in range(5))
+    assert sent[1].startswith("... [Output trimmed due to size] ...")
+    assert "line 14" not in sent[1]
+    assert sent[1].endswith("\n".join(f"line {i}" for i in range(15, 20)))
@@ -48,7 +48,29 @@ def test_terminal_manager_prepare_and_restore():
         assert RESTORE_TERMINAL_SEQ in written_data
         
         assert mock_flush.called
-        assert mock_run.called
+        # termios settings were restored, so no need to fork stty
+        mock_run.assert_not_called()
+
+def test_terminal_manager_restore_falls_back_to_stty():
+    """
+    Verifies that `stty sane` is run when the saved settings can't be restored.
+    """
+    manager = TerminalManager(enabled=True)
+    
+    with (
+        patch("sys.stdin.fileno", return_value=0),
+        patch("termios.tcgetattr", return_value=["old_settings"]),
+        patch("termios.tcsetattr", side_effect=OSError("not a tty")),
+        patch("tty.setraw"),
+        patch("os.write"),
+        patch("termios.tcflush"),
+        patch("subprocess.run") as mock_run,
+    ):
+        manager.prepare_terminal()
+        manager.restore_terminal()
+        
+        mock_run.assert_called_once()
+        assert mock_run.call_args.args[0] == ["stty", "sane"]
 
 def test_terminal_manager_restore_only_once():
     """